@@ -6,9 +6,15 @@ import subprocess
 import time
 import tempfile
 import locale
+import re
 import ctypes
+import ctypes.util
+import difflib
+import hashlib
+import struct
+from datetime import datetime
 from pathlib import Path
-from tkinter import Tk, Listbox, Button, Label, filedialog, messagebox, END, SINGLE, Checkbutton, IntVar, Frame, Scrollbar, RIGHT, Y, LEFT, BOTH, PhotoImage
+from tkinter import Tk, Listbox, Button, Label, filedialog, messagebox, END, SINGLE, Checkbutton, IntVar, Frame, Scrollbar, RIGHT, Y, LEFT, BOTH, PhotoImage, READABLE
 
 # Try to import tkinterdnd2 (optional) for drag-and-drop support
 try:
@@ -32,6 +38,28 @@ CONFIG_FILENAME = 'items.json'
 ICON_FILENAME = 'app_icon.ico'
 AUTO_CLOSE_MS = 10_000  # 10 seconds
 STARTUP_TASK_NAME = f'{APP_NAME}_Logon'
+METRICS_PROM_FILENAME = 'metrics.prom'
+METRICS_JSON_FILENAME = 'metrics.json'
+METRICS_PREFIX = 'autostarter'
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # seconds
+READY_TIMEOUT_S = 3.0  # how long a run waits for launchers to report back
+METRICS_PRUNE_RUNS = 10  # drop per-item metrics not touched in this many runs
+CONFIG_POLL_MS = 1000  # mtime polling interval when inotify is unavailable
+CONFIG_RELOAD_DEBOUNCE_MS = 150
+CONFLICT_SUFFIX = '.conflict'  # unsaved list is kept in items.json.conflict if it can't be saved on exit
+
+# inotify event masks (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+
+DEFER_POLL_S = 15  # how often deferred items re-check their launch conditions
+DEFER_MAX_S = 24 * 60 * 60  # give up on deferred items after a day
+
+# probe sources on Linux
+POWER_SUPPLY_DIR = '/sys/class/power_supply'
+NET_DIR = '/sys/class/net'
+PROC_MOUNTS = '/proc/mounts'
 
 
 def get_appdata_dir():
@@ -149,46 +177,90 @@ def is_self_path(p):
     return False
 
 
-def load_items():
+def parse_items(data):
     """
-    Load items from JSON config. If parse fails, return [] and show a warning to user.
+    Turn decoded config JSON into the in-memory item list.
+    """
+    # Basic validation: expect list of dicts or list of strings
+    if not isinstance(data, list):
+        return []
+    cleaned = []
+    for it in data:
+        if isinstance(it, dict):
+            p = it.get('path') or ''
+            entry = {'path': normalize_path(p), 'name': it.get('name')}
+            conditions = normalize_conditions(it.get('conditions'))
+            if conditions:
+                entry['conditions'] = conditions
+            cleaned.append(entry)
+        else:
+            cleaned.append({'path': normalize_path(str(it))})
+    return cleaned
+
+
+def item_key(it):
+    """
+    Comparable identity of an item, used to diff item lists.
+    """
+    if isinstance(it, dict):
+        conditions = it.get('conditions')
+        return (it.get('path'), it.get('name') or None, json.dumps(conditions, sort_keys=True) if conditions else None)
+    return (str(it), None, None)
+
+
+def config_digest(raw):
+    return hashlib.sha256(raw).hexdigest()
+
+
+def get_config_digest():
+    """
+    Return the SHA-256 of the config file as it is on disk, or None if it doesn't exist.
+    """
+    try:
+        with open(get_config_path(), 'rb') as f:
+            return config_digest(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print('get_config_digest error:', e)
+        return None
+
+
+def load_items_snapshot(quiet=False):
+    """
+    Load items together with the SHA-256 of the file contents they were parsed from.
+    Returns (items, digest); digest is None if the file does not exist.
+    With quiet=True an unreadable file returns (None, digest) instead of warning the user,
+    so callers reloading in the background can keep what they have.
     """
     path = get_config_path()
     if not os.path.exists(path):
-        return []
+        return [], None
+    digest = None
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        # Basic validation: expect list of dicts or list of strings
-        if isinstance(data, list):
-            cleaned = []
-            for it in data:
-                if isinstance(it, dict):
-                    p = it.get('path') or ''
-                    cleaned.append({'path': normalize_path(p), 'name': it.get('name')})
-                else:
-                    cleaned.append({'path': normalize_path(str(it))})
-            return cleaned
-        else:
-            return []
+        with open(path, 'rb') as f:
+            raw = f.read()
+        digest = config_digest(raw)
+        return parse_items(json.loads(raw.decode('utf-8'))), digest
     except json.JSONDecodeError as e:
+        if quiet:
+            return None, digest
         messagebox.showwarning(APP_NAME, f'Config file is corrupted and could not be read: {e}\nStarting with an empty list.')
-        return []
+        return [], digest
     except Exception as e:
         # unknown error - return empty
-        print('load_items error:', e)
-        return []
+        print('load_items_snapshot error:', e)
+        return (None if quiet else []), digest
 
 
-def save_items(items, retries=3):
+def save_items(items, retries=3, path=None):
     """
     Save items using atomic write: write to temp file and then os.replace.
-    Returns (True, None) on success or (False, error_message) on failure.
+    path defaults to the config file.
+    Returns (True, None, digest) on success, digest being the SHA-256 of the bytes written,
+    or (False, error_message, None) on failure.
     """
-    path = get_config_path()
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    tmp_fd = None
-    tmp_path = None
+    path = path or get_config_path()
     try:
         # Filter/normalize items before saving
         to_save = []
@@ -196,23 +268,47 @@ def save_items(items, retries=3):
             if isinstance(it, dict):
                 p = normalize_path(it.get('path', ''))
                 name = it.get('name') if it.get('name') else None
+                conditions = normalize_conditions(it.get('conditions'))
             else:
                 p = normalize_path(str(it))
                 name = None
+                conditions = {}
             # skip empty paths and skip self path
             if not p:
                 continue
             if is_self_path(p):
                 # don't store a path pointing to this app
                 continue
-            to_save.append({'path': p, **({'name': name} if name else {})})
+            to_save.append({'path': p, **({'name': name} if name else {}), **({'conditions': conditions} if conditions else {})})
+
+        data = json.dumps(to_save, indent=2, ensure_ascii=False).encode('utf-8')
+        ok, err = atomic_write_bytes(path, data)
+        return ok, err, (config_digest(data) if ok else None)
+    except Exception as e:
+        return False, str(e), None
+
 
+def atomic_write_text(path, text):
+    """
+    Write text to path atomically as UTF-8 (no newline translation).
+    Returns (True, None) on success or (False, error_message) on failure.
+    """
+    return atomic_write_bytes(path, text.encode('utf-8'))
+
+
+def atomic_write_bytes(path, data):
+    """
+    Write data to path atomically: write to a temp file in the same directory and then os.replace.
+    Returns (True, None) on success or (False, error_message) on failure.
+    """
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
         # use tempfile in same directory (important for atomic replace on same fs)
         dirpath = os.path.dirname(path) or '.'
-        fd, tmp_path = tempfile.mkstemp(prefix=CONFIG_FILENAME, suffix='.tmp', dir=dirpath)
-        tmp_fd = fd
-        with os.fdopen(fd, 'w', encoding='utf-8') as f:
-            json.dump(to_save, f, indent=2, ensure_ascii=False)
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path), suffix='.tmp', dir=dirpath)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
             f.flush()
             os.fsync(f.fileno())
         # atomic replace
@@ -228,19 +324,281 @@ def save_items(items, retries=3):
         return False, str(e)
 
 
-def open_path(path):
+def spawn_path(path):
+    """
+    Start path and return (proc, is_launcher).
+    proc is None for os.startfile; is_launcher is True when proc is xdg-open handing the
+    item to its handler, False when proc is the item itself (direct launch).
+    Raises if neither the shell handler nor a direct launch could start it.
+    """
     # Use os.startfile on Windows - works with .lnk, folders, files, programs
     try:
         if sys.platform.startswith('win'):
             os.startfile(path)
-        else:
-            subprocess.Popen(['xdg-open', path])
+            return None, False
+        return subprocess.Popen(['xdg-open', path]), True
     except Exception:
         # fallback: try to run directly
+        return subprocess.Popen([path]), False
+
+
+def open_path(path):
+    try:
+        return spawn_path(path)
+    except Exception as e:
+        print(f'Failed to open {path}: {e}')
+        return None, False
+
+
+# Launch metrics
+# guards the shared LaunchMetrics instance; every launch thread records into it
+_METRICS_LOCK = threading.RLock()
+_shared_metrics = None
+
+
+def get_metrics_paths():
+    d = get_appdata_dir()
+    return os.path.join(d, METRICS_PROM_FILENAME), os.path.join(d, METRICS_JSON_FILENAME)
+
+
+def _empty_histogram():
+    # one count per bucket in LATENCY_BUCKETS plus the +Inf bucket (not cumulative)
+    return {'buckets': [0] * (len(LATENCY_BUCKETS) + 1), 'sum': 0.0, 'count': 0}
+
+
+def _prom_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _prom_number(value):
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+class LaunchMetrics:
+    """
+    Per-item launch counters and latency histograms, accumulated across runs.
+    State lives in metrics.json next to the config; metrics.prom is rendered from
+    it for the node_exporter textfile collector. Items not touched for
+    METRICS_PRUNE_RUNS runs (e.g. removed from the list) are dropped.
+    """
+
+    COUNTERS = ('launches', 'failures', 'skips', 'deferrals')
+    HISTOGRAMS = ('spawn_seconds', 'handoff_seconds')
+
+    def __init__(self, data=None):
+        data = data if isinstance(data, dict) else {}
+        self.runs = int(data.get('runs') or 0)
+        self.last_run = data.get('last_run')
+        self.items = {}
+        for path, entry in (data.get('items') or {}).items():
+            if isinstance(entry, dict):
+                self.items[path] = self._clean_entry(entry)
+
+    @classmethod
+    def shared(cls):
+        """
+        Return the process-wide instance, loading metrics.json on first use.
+        Concurrent runs (Run now, auto-launch, deferred launches) all record into it,
+        so none of them overwrites the others' counts when writing.
+        """
+        global _shared_metrics
+        with _METRICS_LOCK:
+            if _shared_metrics is None:
+                _shared_metrics = cls.load()
+            return _shared_metrics
+
+    @classmethod
+    def load(cls):
+        _, json_path = get_metrics_paths()
         try:
-            subprocess.Popen([path])
+            with open(json_path, 'r', encoding='utf-8') as f:
+                return cls(json.load(f))
+        except FileNotFoundError:
+            return cls()
         except Exception as e:
-            print(f'Failed to open {path}: {e}')
+            print('Could not read launch metrics, starting fresh:', e)
+            return cls()
+
+    def _clean_entry(self, entry):
+        cleaned = {name: int(entry.get(name) or 0) for name in self.COUNTERS}
+        for name in self.HISTOGRAMS:
+            h = entry.get(name)
+            # drop histograms recorded with a different bucket layout
+            if isinstance(h, dict) and len(h.get('buckets') or []) == len(LATENCY_BUCKETS) + 1:
+                cleaned[name] = {'buckets': [int(c) for c in h['buckets']], 'sum': float(h.get('sum') or 0.0), 'count': int(h.get('count') or 0)}
+            else:
+                cleaned[name] = _empty_histogram()
+        cleaned['last_status'] = entry.get('last_status')
+        cleaned['last_spawn_seconds'] = entry.get('last_spawn_seconds')
+        cleaned['last_handoff_seconds'] = entry.get('last_handoff_seconds')
+        last_seen = entry.get('last_seen_run')
+        cleaned['last_seen_run'] = int(last_seen) if isinstance(last_seen, int) else self.runs
+        return cleaned
+
+    def _entry(self, path):
+        if path not in self.items:
+            self.items[path] = self._clean_entry({})
+        entry = self.items[path]
+        entry['last_seen_run'] = self.runs
+        return entry
+
+    def _observe(self, hist, seconds):
+        idx = len(LATENCY_BUCKETS)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                idx = i
+                break
+        hist['buckets'][idx] += 1
+        hist['sum'] += seconds
+        hist['count'] += 1
+
+    def start_run(self):
+        with _METRICS_LOCK:
+            self.runs += 1
+            self.last_run = time.time()
+            # items removed from the list stop being touched; stop exporting them eventually
+            for path in [p for p, e in self.items.items() if self.runs - e['last_seen_run'] > METRICS_PRUNE_RUNS]:
+                del self.items[path]
+
+    def record_spawn(self, path, spawn_seconds):
+        # the launch itself is counted once its outcome is known (handoff/started/failed)
+        with _METRICS_LOCK:
+            entry = self._entry(path)
+            entry['last_status'] = 'spawned'
+            entry['last_spawn_seconds'] = spawn_seconds
+            entry['last_handoff_seconds'] = None
+            self._observe(entry['spawn_seconds'], spawn_seconds)
+
+    def record_handoff(self, path, handoff_seconds):
+        # xdg-open exited 0: the item was handed to its handler after handoff_seconds
+        with _METRICS_LOCK:
+            entry = self._entry(path)
+            entry['launches'] += 1
+            entry['last_status'] = 'handed_off'
+            entry['last_handoff_seconds'] = handoff_seconds
+            self._observe(entry['handoff_seconds'], handoff_seconds)
+
+    def record_started(self, path, status):
+        # started, but nothing beyond the spawn could be timed (os.startfile, direct launch)
+        with _METRICS_LOCK:
+            entry = self._entry(path)
+            entry['launches'] += 1
+            entry['last_status'] = status
+
+    def record_failure(self, path):
+        with _METRICS_LOCK:
+            entry = self._entry(path)
+            entry['failures'] += 1
+            entry['last_status'] = 'failed'
+
+    def record_skip(self, path):
+        with _METRICS_LOCK:
+            entry = self._entry(path)
+            entry['skips'] += 1
+            entry['last_status'] = 'skipped'
+
+    def record_deferral(self, path):
+        with _METRICS_LOCK:
+            entry = self._entry(path)
+            entry['deferrals'] += 1
+            entry['last_status'] = 'deferred'
+
+    def to_dict(self):
+        with _METRICS_LOCK:
+            return {
+                'runs': self.runs,
+                'last_run': self.last_run,
+                'buckets': list(LATENCY_BUCKETS),
+                'items': json.loads(json.dumps(self.items)),
+            }
+
+    def render_prometheus(self):
+        data = self.to_dict()
+        items = sorted(data['items'].items())
+        lines = [
+            f'# HELP {METRICS_PREFIX}_runs_total Launch runs performed.',
+            f'# TYPE {METRICS_PREFIX}_runs_total counter',
+            f'{METRICS_PREFIX}_runs_total {data["runs"]}',
+            f'# HELP {METRICS_PREFIX}_last_run_timestamp_seconds Unix time of the last launch run.',
+            f'# TYPE {METRICS_PREFIX}_last_run_timestamp_seconds gauge',
+            f'{METRICS_PREFIX}_last_run_timestamp_seconds {_prom_number(float(data["last_run"] or 0))}',
+        ]
+        helps = {
+            'launches': 'Items started successfully (spawned without error and the launcher, if any, did not exit with an error).',
+            'failures': 'Items that could not be started or whose launcher exited with an error.',
+            'skips': 'Items skipped without launching.',
+            'deferrals': 'Items held back because their launch conditions were not met.',
+        }
+        for name in self.COUNTERS:
+            metric = f'{METRICS_PREFIX}_{name}_total'
+            lines.append(f'# HELP {metric} {helps[name]}')
+            lines.append(f'# TYPE {metric} counter')
+            for path, entry in items:
+                lines.append(f'{metric}{{item="{_prom_label(path)}"}} {entry[name]}')
+        helps = {
+            'spawn_seconds': 'Time taken by the spawn call (os.startfile or process creation).',
+            'handoff_seconds': 'Time from launch until xdg-open exited 0 after handing the item to its handler; not observed for os.startfile or direct launches, where nothing past the spawn is measurable.',
+        }
+        for name in self.HISTOGRAMS:
+            metric = f'{METRICS_PREFIX}_{name}'
+            lines.append(f'# HELP {metric} {helps[name]}')
+            lines.append(f'# TYPE {metric} histogram')
+            for path, entry in items:
+                label = _prom_label(path)
+                h = entry[name]
+                cumulative = 0
+                for bound, count in zip(list(LATENCY_BUCKETS) + ['+Inf'], h['buckets']):
+                    cumulative += count
+                    le = bound if bound == '+Inf' else _prom_number(float(bound))
+                    lines.append(f'{metric}_bucket{{item="{label}",le="{le}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{item="{label}"}} {_prom_number(float(h["sum"]))}')
+                lines.append(f'{metric}_count{{item="{label}"}} {h["count"]}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self):
+        """
+        Write metrics.json and metrics.prom atomically.
+        Returns (True, None) on success or (False, error_message) on failure.
+        """
+        prom_path, json_path = get_metrics_paths()
+        with _METRICS_LOCK:
+            ok, err = atomic_write_text(json_path, json.dumps(self.to_dict(), indent=2, ensure_ascii=False))
+            if not ok:
+                return ok, err
+            return atomic_write_text(prom_path, self.render_prometheus())
+
+
+def wait_for_ready(pending, metrics, timeout=READY_TIMEOUT_S):
+    """
+    Wait for spawned processes to report back.
+    pending: list of (path, Popen, start_time, is_launcher). A non-zero exit counts as a
+    failure. An xdg-open launcher exiting 0 is timed as the handoff; a direct launch
+    exiting 0, or anything still running at the timeout, counts as launched but untimed.
+    """
+    deadline = time.perf_counter() + timeout
+    while pending:
+        still_running = []
+        for path, proc, started, is_launcher in pending:
+            rc = proc.poll()
+            if rc is None:
+                still_running.append((path, proc, started, is_launcher))
+            elif rc != 0:
+                print('Launcher for', path, 'exited with code', rc)
+                metrics.record_failure(path)
+            elif is_launcher:
+                metrics.record_handoff(path, time.perf_counter() - started)
+            else:
+                metrics.record_started(path, 'exited')
+        pending = still_running
+        if not pending:
+            break
+        if time.perf_counter() >= deadline:
+            for path, _, _, _ in pending:
+                metrics.record_started(path, 'running')
+            break
+        time.sleep(0.02)
 
 
 # Startup handling
@@ -402,6 +760,387 @@ def startup_entry_exists():
     return startup_task_exists() or startup_shortcut_exists()
 
 
+# Launch conditions
+def parse_time_window(value):
+    """
+    Parse 'HH:MM-HH:MM' into ((h, m), (h, m)), or return None if it isn't one
+    or if start and end are equal.
+    """
+    try:
+        start, end = str(value).split('-')
+        bounds = []
+        for part in (start, end):
+            h, m = part.strip().split(':')
+            h, m = int(h), int(m)
+            if not (0 <= h <= 23 and 0 <= m <= 59):
+                return None
+            bounds.append((h, m))
+        if bounds[0] == bounds[1]:
+            # an empty window would defer the item forever
+            return None
+        return tuple(bounds)
+    except Exception:
+        return None
+
+
+def normalize_conditions(raw):
+    """
+    Clean the 'conditions' dict of an item. Supported keys:
+      ac_power: true            - only launch when running on mains power
+      network: "wlan0" | [...]  - only launch when one of these interfaces is up (Linux interface
+                                  name, or the Windows adapter name such as "Wi-Fi"; not checked elsewhere)
+      path: "..."               - only launch when this path exists
+      mount: "..."              - only launch when this path is a mount point
+      time_window: "HH:MM-HH:MM" - only launch inside this local time window (may wrap midnight)
+    Unknown or invalid entries are dropped.
+    """
+    if not isinstance(raw, dict):
+        return {}
+    out = {}
+    for key, value in raw.items():
+        if key == 'ac_power':
+            if value:
+                out['ac_power'] = True
+        elif key == 'network':
+            names = [value] if isinstance(value, str) else value if isinstance(value, list) else []
+            names = [str(n).strip() for n in names if str(n).strip()]
+            if names:
+                out['network'] = names
+        elif key in ('path', 'mount'):
+            if isinstance(value, str) and value.strip():
+                out[key] = normalize_path(value)
+        elif key == 'time_window' and parse_time_window(value):
+            out['time_window'] = str(value).strip()
+        else:
+            print(f'Ignoring unsupported launch condition {key!r}: {value!r}')
+    return out
+
+
+def describe_conditions(conditions):
+    parts = []
+    if conditions.get('ac_power'):
+        parts.append('AC power')
+    if conditions.get('network'):
+        parts.append('net ' + '/'.join(conditions['network']))
+    if conditions.get('path'):
+        parts.append('path ' + conditions['path'])
+    if conditions.get('mount'):
+        parts.append('mount ' + conditions['mount'])
+    if conditions.get('time_window'):
+        parts.append(conditions['time_window'])
+    return ', '.join(parts)
+
+
+def _read_text(path):
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+class _IP_ADAPTER_ADDRESSES(ctypes.Structure):
+    # leading fields of IP_ADAPTER_ADDRESSES (iphlpapi.h), up to OperStatus; ULONG is 32-bit
+    _fields_ = [
+        ('Length', ctypes.c_uint32),
+        ('IfIndex', ctypes.c_uint32),
+        ('Next', ctypes.c_void_p),
+        ('AdapterName', ctypes.c_char_p),
+        ('FirstUnicastAddress', ctypes.c_void_p),
+        ('FirstAnycastAddress', ctypes.c_void_p),
+        ('FirstMulticastAddress', ctypes.c_void_p),
+        ('FirstDnsServerAddress', ctypes.c_void_p),
+        ('DnsSuffix', ctypes.c_wchar_p),
+        ('Description', ctypes.c_wchar_p),
+        ('FriendlyName', ctypes.c_wchar_p),
+        ('PhysicalAddress', ctypes.c_ubyte * 8),
+        ('PhysicalAddressLength', ctypes.c_uint32),
+        ('Flags', ctypes.c_uint32),
+        ('Mtu', ctypes.c_uint32),
+        ('IfType', ctypes.c_uint32),
+        ('OperStatus', ctypes.c_int),
+    ]
+
+
+def _windows_adapters_up():
+    """
+    Return the friendly names ("Wi-Fi", "Ethernet", ...) of adapters whose OperStatus
+    is IfOperStatusUp, using GetAdaptersAddresses.
+    """
+    GAA_FLAG_SKIP_ADDRESSES = 0x1 | 0x2 | 0x4 | 0x8  # unicast, anycast, multicast, dns
+    ERROR_BUFFER_OVERFLOW = 111
+    IF_OPER_STATUS_UP = 1
+    size = ctypes.c_uint32(16 * 1024)
+    for _ in range(3):
+        buf = ctypes.create_string_buffer(size.value)
+        rc = ctypes.windll.iphlpapi.GetAdaptersAddresses(0, GAA_FLAG_SKIP_ADDRESSES, None, buf, ctypes.byref(size))
+        if rc != ERROR_BUFFER_OVERFLOW:
+            break
+    if rc != 0:
+        return None
+    up = set()
+    addr = ctypes.addressof(buf)
+    while addr:
+        adapter = _IP_ADAPTER_ADDRESSES.from_address(addr)
+        if adapter.OperStatus == IF_OPER_STATUS_UP and adapter.FriendlyName:
+            up.add(adapter.FriendlyName)
+        addr = adapter.Next
+    return up
+
+
+class SystemProbes:
+    """
+    Snapshot of the system state launch conditions depend on.
+    Each probe is read at most once per snapshot, from cheap sources (/sys, /proc,
+    GetSystemPowerStatus, GetAdaptersAddresses), and shared by every item evaluated
+    against it. A probe that can't tell returns None, and conditions depending on it
+    are treated as met.
+    """
+
+    def __init__(self):
+        self.now = datetime.now()
+        self._cache = {}
+
+    def _cached(self, key, fn):
+        if key not in self._cache:
+            try:
+                self._cache[key] = fn()
+            except Exception as e:
+                print(f'Probe {key} failed:', e)
+                self._cache[key] = None
+        return self._cache[key]
+
+    def on_ac_power(self):
+        return self._cached('ac_power', self._probe_ac_power)
+
+    def network_interfaces_up(self):
+        return self._cached('network', self._probe_network)
+
+    def mounts(self):
+        return self._cached('mounts', self._probe_mounts)
+
+    def path_exists(self, path):
+        return self._cached(('path', path), lambda: os.path.exists(path))
+
+    def _probe_ac_power(self):
+        if sys.platform.startswith('win'):
+            class SYSTEM_POWER_STATUS(ctypes.Structure):
+                _fields_ = [
+                    ('ACLineStatus', ctypes.c_ubyte),
+                    ('BatteryFlag', ctypes.c_ubyte),
+                    ('BatteryLifePercent', ctypes.c_ubyte),
+                    ('SystemStatusFlag', ctypes.c_ubyte),
+                    ('BatteryLifeTime', ctypes.c_ulong),
+                    ('BatteryFullLifeTime', ctypes.c_ulong),
+                ]
+            status = SYSTEM_POWER_STATUS()
+            if not ctypes.windll.kernel32.GetSystemPowerStatus(ctypes.byref(status)):
+                return None
+            return {0: False, 1: True}.get(status.ACLineStatus)
+        base = POWER_SUPPLY_DIR
+        if not os.path.isdir(base):
+            return None
+        have_adapter = False
+        battery_states = []
+        for name in os.listdir(base):
+            # peripheral batteries (wireless mice, keyboards) report scope=Device
+            if _read_text(os.path.join(base, name, 'scope')) == 'Device':
+                continue
+            kind = _read_text(os.path.join(base, name, 'type'))
+            if kind in ('Mains', 'USB', 'USB_C', 'USB_PD'):
+                have_adapter = True
+                if _read_text(os.path.join(base, name, 'online')) == '1':
+                    return True
+            elif kind == 'Battery':
+                battery_states.append(_read_text(os.path.join(base, name, 'status')))
+        if have_adapter:
+            return False
+        if battery_states:
+            return 'Discharging' not in battery_states
+        # no adapter and no battery reported: a desktop
+        return True
+
+    def _probe_network(self):
+        if sys.platform.startswith('win'):
+            return _windows_adapters_up()
+        base = NET_DIR
+        if os.path.isdir(base):
+            up = set()
+            for name in os.listdir(base):
+                # 'unknown' is what tun/ppp and some wifi drivers report while usable
+                if _read_text(os.path.join(base, name, 'operstate')) in ('up', 'unknown'):
+                    up.add(name)
+            return up
+        # no cheap source for the operational state elsewhere: can't tell
+        return None
+
+    def _probe_mounts(self):
+        text = _read_text(PROC_MOUNTS)
+        if text is None:
+            return None
+        mounts = set()
+        for line in text.splitlines():
+            fields = line.split()
+            if len(fields) >= 2:
+                # /proc/mounts escapes spaces and friends as octal
+                mounts.add(re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), fields[1]))
+        return mounts
+
+
+def unmet_conditions(conditions, probes):
+    """
+    Return human-readable reasons why conditions aren't met by probes (empty when they are).
+    """
+    reasons = []
+    if not conditions:
+        return reasons
+    if conditions.get('ac_power') and probes.on_ac_power() is False:
+        reasons.append('not on AC power')
+    if conditions.get('network'):
+        up = probes.network_interfaces_up()
+        if up is not None and not any(n in up for n in conditions['network']):
+            reasons.append('network ' + '/'.join(conditions['network']) + ' not up')
+    if conditions.get('path') and not probes.path_exists(conditions['path']):
+        reasons.append(conditions['path'] + ' not available')
+    if conditions.get('mount'):
+        mounts = probes.mounts()
+        target = conditions['mount']
+        mounted = target in mounts if mounts is not None else os.path.ismount(target)
+        if not mounted:
+            reasons.append(target + ' not mounted')
+    window = parse_time_window(conditions.get('time_window')) if conditions.get('time_window') else None
+    if window:
+        (sh, sm), (eh, em) = window
+        now = probes.now.hour * 60 + probes.now.minute
+        start, end = sh * 60 + sm, eh * 60 + em
+        inside = start <= now < end if start <= end else (now >= start or now < end)
+        if not inside:
+            reasons.append('outside ' + conditions['time_window'])
+    return reasons
+
+
+# Config watching
+class ConfigWatcher:
+    """
+    Watch the config file for changes made outside this window and call on_change().
+    Uses inotify on Linux (serviced by the Tk event loop, no thread) and falls back to
+    polling the file's mtime and size with root.after everywhere else.
+    The directory is watched rather than the file because save_items replaces the file.
+    """
+
+    def __init__(self, root, path, on_change):
+        self.root = root
+        self.path = path
+        self.on_change = on_change
+        self.mode = None
+        self.fd = None
+        self.poll_after_id = None
+        self.debounce_after_id = None
+        self.last_stat = self._stat()
+
+    def start(self):
+        if sys.platform.startswith('linux') and self._start_inotify():
+            self.mode = 'inotify'
+        else:
+            self.mode = 'poll'
+            self.poll_after_id = self.root.after(CONFIG_POLL_MS, self._poll)
+
+    def stop(self):
+        for after_id in (self.poll_after_id, self.debounce_after_id):
+            if after_id:
+                try:
+                    self.root.after_cancel(after_id)
+                except Exception:
+                    pass
+        self.poll_after_id = None
+        self.debounce_after_id = None
+        if self.fd is not None:
+            try:
+                self.root.tk.deletefilehandler(self.fd)
+            except Exception:
+                pass
+            try:
+                os.close(self.fd)
+            except Exception:
+                pass
+            self.fd = None
+
+    def _start_inotify(self):
+        fd = None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return False
+            dirpath = os.fsencode(os.path.dirname(self.path))
+            if libc.inotify_add_watch(fd, dirpath, IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE) < 0:
+                os.close(fd)
+                return False
+            self.root.tk.createfilehandler(fd, READABLE, self._on_inotify)
+            self.fd = fd
+            return True
+        except Exception as e:
+            print('inotify unavailable, polling config instead:', e)
+            if fd is not None and fd >= 0:
+                try:
+                    os.close(fd)
+                except Exception:
+                    pass
+            return False
+
+    def _on_inotify(self, fd, mask):
+        name = os.fsencode(os.path.basename(self.path))
+        hit = False
+        while True:
+            try:
+                buf = os.read(fd, 4096)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                break
+            if not buf:
+                break
+            offset = 0
+            while offset + 16 <= len(buf):
+                _wd, _mask, _cookie, length = struct.unpack_from('iIII', buf, offset)
+                if buf[offset + 16:offset + 16 + length].rstrip(b'\0') == name:
+                    hit = True
+                offset += 16 + length
+        if hit:
+            self._changed()
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _poll(self):
+        self.poll_after_id = None
+        st = self._stat()
+        if st != self.last_stat:
+            self.last_stat = st
+            self._changed()
+        self.poll_after_id = self.root.after(CONFIG_POLL_MS, self._poll)
+
+    def _changed(self):
+        # editors often write in several steps; wait for the burst to settle
+        if self.debounce_after_id:
+            try:
+                self.root.after_cancel(self.debounce_after_id)
+            except Exception:
+                pass
+        self.debounce_after_id = self.root.after(CONFIG_RELOAD_DEBOUNCE_MS, self._fire)
+
+    def _fire(self):
+        self.debounce_after_id = None
+        try:
+            self.on_change()
+        except Exception as e:
+            print('Config reload error:', e)
+
+
 # GUI
 class StarterApp:
     def __init__(self, root):
@@ -410,10 +1149,16 @@ class StarterApp:
         self._icon_image = None
         self._apply_window_icon()
 
-        self.items = load_items()
+        self.items, self.loaded_digest = load_items_snapshot()
+        self.loaded_keys = [item_key(it) for it in self.items]
         self.auto_close_after_id = None
         self.auto_close_enabled = True
         self.clicked = False
+        self.auto_launched = False
+        # deferred items: path -> time.monotonic() when first deferred, served by one worker
+        self.deferred = {}
+        self.deferred_lock = threading.Lock()
+        self.deferred_thread = None
 
         # Main frame
         frame = Frame(root)
@@ -447,12 +1192,19 @@ class StarterApp:
         # Info label
         info = 'Auto Starting of apps, folders, shortcuts and all                     by: MrBoxik'
         Label(root, text=info).pack(fill='x')
+        self.status_label = Label(root, text='')
+        self.status_label.pack(fill='x')
 
         # Fill listbox
         self.refresh_listbox()
 
+        # Pick up edits made to items.json by scripts or other instances
+        self.config_watcher = ConfigWatcher(root, get_config_path(), self.on_config_changed)
+        self.config_watcher.start()
+
         # Bind events
         self.root.bind_all('<Button>', self.on_any_click)
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
         self.listbox.bind('<Double-1>', self.open_selected)
 
         # Setup drag-and-drop using tkinterdnd2 when available.
@@ -486,13 +1238,68 @@ class StarterApp:
         except Exception:
             pass
 
+    def _display_text(self, it):
+        p = it.get('path') if isinstance(it, dict) else str(it)
+        name = it.get('name') if isinstance(it, dict) and it.get('name') else os.path.basename(p)
+        display = name + '    [' + p + ']'
+        conditions = it.get('conditions') if isinstance(it, dict) else None
+        if conditions:
+            display += '    (when: ' + describe_conditions(conditions) + ')'
+        return display
+
     def refresh_listbox(self):
         self.listbox.delete(0, END)
         for it in self.items:
-            p = it.get('path') if isinstance(it, dict) else str(it)
-            name = it.get('name') if isinstance(it, dict) and it.get('name') else os.path.basename(p)
-            display = name + '    [' + p + ']'
-            self.listbox.insert(END, display)
+            self.listbox.insert(END, self._display_text(it))
+
+    def apply_items(self, new_items):
+        """
+        Replace self.items with new_items, touching only the listbox rows that differ.
+        Returns the number of rows changed.
+        """
+        old_keys = [item_key(it) for it in self.items]
+        new_keys = [item_key(it) for it in new_items]
+        sel = self.listbox.curselection()
+        selected_key = old_keys[sel[0]] if sel and sel[0] < len(old_keys) else None
+        changed = 0
+        matcher = difflib.SequenceMatcher(a=old_keys, b=new_keys, autojunk=False)
+        # apply from the end so earlier indices stay valid
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == 'equal':
+                continue
+            if i2 > i1:
+                self.listbox.delete(i1, i2 - 1)
+            for offset, it in enumerate(new_items[j1:j2]):
+                self.listbox.insert(i1 + offset, self._display_text(it))
+            self.items[i1:i2] = new_items[j1:j2]
+            changed += max(i2 - i1, j2 - j1)
+        if selected_key is not None and selected_key in new_keys:
+            self.listbox.selection_clear(0, END)
+            self.listbox.selection_set(new_keys.index(selected_key))
+        return changed
+
+    def has_unsaved_changes(self):
+        return [item_key(it) for it in self.items] != self.loaded_keys
+
+    def mark_in_sync(self, digest):
+        self.loaded_digest = digest
+        self.loaded_keys = [item_key(it) for it in self.items]
+
+    def on_config_changed(self):
+        """
+        Called by the config watcher. Merge external edits unless the list has unsaved
+        local edits, in which case the conflict is left for save() to resolve.
+        """
+        items, digest = load_items_snapshot(quiet=True)
+        if items is None or digest is None or digest == self.loaded_digest:
+            # unreadable (mid-write), deleted, or our own save
+            return
+        if self.has_unsaved_changes():
+            self.status_label.config(text=f'{CONFIG_FILENAME} changed on disk; Save will ask before overwriting it.')
+            return
+        changed = self.apply_items(items)
+        self.mark_in_sync(digest)
+        self.status_label.config(text=f'Reloaded {CONFIG_FILENAME} ({changed} row(s) changed).')
 
     def add_items(self):
         paths = filedialog.askopenfilenames(title='Select files or shortcuts to add')
@@ -571,29 +1378,213 @@ class StarterApp:
     def run_now(self):
         threading.Thread(target=self.launch_all).start()
 
+    def _launch_item(self, p_norm, metrics, pending):
+        started = time.perf_counter()
+        try:
+            proc, is_launcher = spawn_path(p_norm)
+        except Exception as e:
+            print('Error launching', p_norm, e)
+            metrics.record_failure(p_norm)
+            return
+        spawn_seconds = time.perf_counter() - started
+        metrics.record_spawn(p_norm, spawn_seconds)
+        if proc is None:
+            # os.startfile gives no handle; whether the item came up is unknown
+            metrics.record_started(p_norm, 'started')
+        else:
+            pending.append((p_norm, proc, started, is_launcher))
+
     def launch_all(self):
         """
         Launch all items, skipping anything that appears to be this app itself.
+        Items whose launch conditions aren't met are queued for the deferred worker.
+        Launch outcomes and latencies are exported via LaunchMetrics after the run.
         """
-        for it in self.items:
+        metrics = LaunchMetrics.shared()
+        metrics.start_run()
+        probes = SystemProbes()
+        pending = []
+        for it in list(self.items):
             p = it.get('path') if isinstance(it, dict) else it
             p_norm = normalize_path(p)
             if is_self_path(p_norm):
                 print('Skipping self-launch for', p_norm)
+                metrics.record_skip(p_norm)
                 continue
-            try:
-                open_path(p_norm)
-                time.sleep(0.05)
-            except Exception as e:
-                print('Error launching', p_norm, e)
+            conditions = it.get('conditions') if isinstance(it, dict) else None
+            reasons = unmet_conditions(conditions, probes)
+            with self.deferred_lock:
+                if reasons:
+                    self.deferred.setdefault(p_norm, time.monotonic())
+                else:
+                    self.deferred.pop(p_norm, None)
+            if reasons:
+                print('Deferring', p_norm + ':', ', '.join(reasons))
+                metrics.record_deferral(p_norm)
+                continue
+            self._launch_item(p_norm, metrics, pending)
+            time.sleep(0.05)
+        wait_for_ready(pending, metrics)
+        ok, err = metrics.write()
+        if not ok:
+            print('Could not write launch metrics:', err)
+        self.start_deferred_worker()
+
+    def start_deferred_worker(self):
+        """
+        Start the deferred worker if items are queued and it isn't running yet.
+        It's a daemon thread: closing the window ends it, unless main() waits for it.
+        """
+        with self.deferred_lock:
+            if not self.deferred or (self.deferred_thread and self.deferred_thread.is_alive()):
+                return
+            self.deferred_thread = threading.Thread(target=self._deferred_worker, daemon=True)
+            self.deferred_thread.start()
+
+    def deferred_paths(self):
+        with self.deferred_lock:
+            return sorted(self.deferred)
+
+    def wait_for_deferred(self):
+        thread = self.deferred_thread
+        if thread:
+            thread.join()
+
+    def _current_item(self, p_norm):
+        # deferred paths are re-checked against the list as it is now (hot reload, removals)
+        for it in list(self.items):
+            p = it.get('path') if isinstance(it, dict) else it
+            if normalize_path(p) == p_norm:
+                return it
+        return None
+
+    def _deferred_worker(self):
+        """
+        Re-check deferred items every DEFER_POLL_S against fresh probes and launch each
+        one as soon as its conditions are met. Items removed from the list are dropped,
+        and items still waiting DEFER_MAX_S after they were first deferred are given up.
+        """
+        while True:
+            time.sleep(DEFER_POLL_S)
+            probes = SystemProbes()
+            to_launch = []
+            with self.deferred_lock:
+                for p_norm, since in list(self.deferred.items()):
+                    it = self._current_item(p_norm)
+                    if it is None or is_self_path(p_norm):
+                        print('No longer in the list, dropping deferred', p_norm)
+                        del self.deferred[p_norm]
+                    elif not unmet_conditions(it.get('conditions') if isinstance(it, dict) else None, probes):
+                        del self.deferred[p_norm]
+                        to_launch.append(p_norm)
+                    elif time.monotonic() - since >= DEFER_MAX_S:
+                        print('Gave up waiting for launch conditions of', p_norm)
+                        del self.deferred[p_norm]
+            if to_launch:
+                metrics = LaunchMetrics.shared()
+                pending = []
+                for p_norm in to_launch:
+                    print('Conditions met, launching', p_norm)
+                    self._launch_item(p_norm, metrics, pending)
+                    time.sleep(0.05)
+                wait_for_ready(pending, metrics)
+                ok, err = metrics.write()
+                if not ok:
+                    print('Could not write launch metrics:', err)
+            with self.deferred_lock:
+                if not self.deferred:
+                    self.deferred_thread = None
+                    return
+
+    def config_changed_on_disk(self):
+        return get_config_digest() not in (None, self.loaded_digest)
+
+    def resolve_config_conflict(self):
+        """
+        Ask what to do when items.json changed on disk since it was loaded.
+        Returns 'overwrite', 'reloaded' or None (cancelled, or the file couldn't be reloaded).
+        """
+        answer = messagebox.askyesnocancel(
+            APP_NAME,
+            f'{CONFIG_FILENAME} was changed outside AutoStarter since it was loaded.\n\n'
+            'Yes: overwrite it with this list\nNo: discard your edits and reload it\nCancel: do nothing')
+        if answer is None:
+            return None
+        if answer:
+            return 'overwrite'
+        items, digest = load_items_snapshot(quiet=True)
+        if items is None:
+            # keep our list and leave the (possibly hand-recoverable) file alone
+            messagebox.showerror('Error', f'{CONFIG_FILENAME} could not be parsed; keeping the current list.')
+            return None
+        self.apply_items(items)
+        self.mark_in_sync(digest)
+        self.status_label.config(text=f'Reloaded {CONFIG_FILENAME}.')
+        return 'reloaded'
 
     def save(self):
-        ok, err = save_items(self.items)
+        if self.config_changed_on_disk():
+            if self.resolve_config_conflict() != 'overwrite':
+                return
+        ok, err, digest = save_items(self.items)
         if ok:
+            self.mark_in_sync(digest)
+            self.status_label.config(text='')
             messagebox.showinfo('Saved', 'Saved ' + str(len(self.items)) + ' items.')
         else:
             messagebox.showerror('Error', f'Could not save config: {err}')
 
+    def on_close(self):
+        """
+        WM_DELETE_WINDOW handler: settle a config conflict while the window is still up,
+        so the save on exit never has to drop the user's edits.
+        """
+        if self.config_changed_on_disk() and self.has_unsaved_changes():
+            resolution = self.resolve_config_conflict()
+            if resolution is None:
+                return
+            if resolution == 'overwrite':
+                ok, err, digest = save_items(self.items)
+                if not ok:
+                    messagebox.showerror('Error', f'Could not save config: {err}')
+                    return
+                self.mark_in_sync(digest)
+        pending = self.deferred_paths()
+        if pending and not self.auto_launched:
+            # only the logon auto-launch waits for deferred items after the window is gone
+            self.status_label.config(text='Not launched (conditions not met yet): ' + ', '.join(pending))
+            if not messagebox.askokcancel(
+                    APP_NAME,
+                    'These items are still waiting for their launch conditions and will not be launched '
+                    'if you close AutoStarter now:\n\n' + '\n'.join(pending) + '\n\nClose anyway?'):
+                return
+        self.root.quit()
+
+    def save_on_exit(self):
+        """
+        Save silently on exit, but never overwrite changes another writer made meanwhile.
+        If that leaves local edits unsaved, they go to items.json.conflict instead.
+        """
+        if not self.config_changed_on_disk():
+            ok, err, digest = save_items(self.items)
+            if ok:
+                self.mark_in_sync(digest)
+            return
+        if not self.has_unsaved_changes():
+            # nothing of ours to keep; the newer file on disk wins
+            return
+        side_path = get_config_path() + CONFLICT_SUFFIX
+        ok, err, _ = save_items(self.items, path=side_path)
+        if ok:
+            msg = f'{CONFIG_FILENAME} was changed outside AutoStarter, so your unsaved list was written to {side_path} instead.'
+        else:
+            msg = f'{CONFIG_FILENAME} was changed outside AutoStarter and your unsaved list could not be kept: {err}'
+        print(msg)
+        try:
+            messagebox.showwarning(APP_NAME, msg)
+        except Exception:
+            pass
+
     def toggle_startup(self):
         if self.startup_var.get():
             target, args_list = get_startup_launch_target_and_args()
@@ -666,6 +1657,8 @@ class StarterApp:
 
     def _launch_and_exit_worker(self):
         self.launch_all()
+        # tells main() to wait for deferred items once the window is gone
+        self.auto_launched = True
         # wait a short moment then exit GUI
         time.sleep(0.2)
         try:
@@ -689,8 +1682,11 @@ def main():
     # If the program was launched with --run (or from startup), we still show GUI for 10s and then auto-launch
     # But user can also pass --nobox to skip GUI (headless launch) if they like
     if '--nobox' in sys.argv:
-        # headless: launch and exit immediately
+        # headless: launch and exit immediately (after any deferred items have launched)
+        app.config_watcher.stop()
+        root.destroy()
         app.launch_all()
+        app.wait_for_deferred()
         return
 
     try:
@@ -698,8 +1694,21 @@ def main():
     except KeyboardInterrupt:
         pass
     finally:
+        app.config_watcher.stop()
         # Save before exit
-        save_items(app.items)
+        app.save_on_exit()
+        try:
+            root.destroy()
+        except Exception:
+            pass
+    # Only the logon auto-launch keeps running (windowless) for deferred items;
+    # closing the window by hand ends the daemon worker with the process.
+    if app.auto_launched:
+        app.wait_for_deferred()
+    else:
+        pending = app.deferred_paths()
+        if pending:
+            print('Window closed; not waiting for deferred items:', ', '.join(pending))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,109 @@
+import ctypes
+from datetime import datetime
+
+import pytest
+
+import AutoStarter as A
+
+
+class FakeProbes:
+    def __init__(self, now, ac=True, up=None, mounts=None, paths=()):
+        self.now = now
+        self._ac = ac
+        self._up = up
+        self._mounts = mounts
+        self._paths = set(paths)
+
+    def on_ac_power(self):
+        return self._ac
+
+    def network_interfaces_up(self):
+        return self._up
+
+    def mounts(self):
+        return self._mounts
+
+    def path_exists(self, path):
+        return path in self._paths
+
+
+def at(hour, minute=0):
+    return FakeProbes(datetime(2024, 1, 1, hour, minute))
+
+
+def test_parse_time_window():
+    assert A.parse_time_window('08:00-18:30') == ((8, 0), (18, 30))
+    assert A.parse_time_window(' 22:00 - 06:00 ') == ((22, 0), (6, 0))
+    for bad in ('00:00-00:00', '24:00-06:00', '08:60-09:00', '08:00', 'soon', None):
+        assert A.parse_time_window(bad) is None
+
+
+def test_normalize_conditions_cleans_and_drops():
+    raw = {'ac_power': True, 'network': 'wlan0', 'path': '/data', 'time_window': '00:00-00:00', 'bogus': 1}
+    assert A.normalize_conditions(raw) == {'ac_power': True, 'network': ['wlan0'], 'path': A.normalize_path('/data')}
+    assert A.normalize_conditions({'network': ['eth0', ' ', 'Wi-Fi']}) == {'network': ['eth0', 'Wi-Fi']}
+    assert A.normalize_conditions({'ac_power': False}) == {}
+    assert A.normalize_conditions('nope') == {}
+
+
+@pytest.mark.parametrize('hour,inside', [(7, False), (8, True), (17, True), (18, False)])
+def test_time_window_same_day(hour, inside):
+    assert (A.unmet_conditions({'time_window': '08:00-18:00'}, at(hour)) == []) is inside
+
+
+@pytest.mark.parametrize('hour,inside', [(21, False), (22, True), (23, True), (0, True), (5, True), (6, False), (12, False)])
+def test_time_window_wraps_midnight(hour, inside):
+    assert (A.unmet_conditions({'time_window': '22:00-06:00'}, at(hour)) == []) is inside
+
+
+def test_unknown_probe_counts_as_met():
+    probes = FakeProbes(datetime(2024, 1, 1), ac=None, up=None)
+    assert A.unmet_conditions({'ac_power': True, 'network': ['Wi-Fi']}, probes) == []
+
+
+def test_unmet_reasons():
+    probes = FakeProbes(datetime(2024, 1, 1), ac=False, up={'eth0'}, mounts={'/'}, paths=())
+    conditions = {'ac_power': True, 'network': ['wlan0'], 'path': '/data', 'mount': '/mnt/nas'}
+    assert len(A.unmet_conditions(conditions, probes)) == 4
+    probes = FakeProbes(datetime(2024, 1, 1), ac=True, up={'wlan0'}, mounts={'/mnt/nas'}, paths={'/data'})
+    assert A.unmet_conditions(conditions, probes) == []
+
+
+def write_supply(base, name, **files):
+    d = base / name
+    d.mkdir()
+    for key, value in files.items():
+        (d / key).write_text(value + '\n')
+
+
+def test_ac_power_ignores_device_batteries(tmp_path, monkeypatch):
+    monkeypatch.setattr(A.sys, 'platform', 'linux')
+    monkeypatch.setattr(A, 'POWER_SUPPLY_DIR', str(tmp_path))
+    write_supply(tmp_path, 'hid-mouse-battery', type='Battery', scope='Device', status='Discharging')
+    assert A.SystemProbes().on_ac_power() is True
+    write_supply(tmp_path, 'BAT0', type='Battery', status='Discharging')
+    assert A.SystemProbes().on_ac_power() is False
+    write_supply(tmp_path, 'AC', type='Mains', online='1')
+    assert A.SystemProbes().on_ac_power() is True
+
+
+def test_network_probe_reads_operstate(tmp_path, monkeypatch):
+    monkeypatch.setattr(A.sys, 'platform', 'linux')
+    monkeypatch.setattr(A, 'NET_DIR', str(tmp_path))
+    for name, state in (('eth0', 'down'), ('wlan0', 'up'), ('tun0', 'unknown')):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / 'operstate').write_text(state + '\n')
+    assert A.SystemProbes().network_interfaces_up() == {'wlan0', 'tun0'}
+
+
+def test_mounts_probe_unescapes_octal(tmp_path, monkeypatch):
+    mounts = tmp_path / 'mounts'
+    mounts.write_text('/dev/sda1 / ext4 rw 0 0\nnas:/share /mnt/my\\040nas nfs rw 0 0\n')
+    monkeypatch.setattr(A, 'PROC_MOUNTS', str(mounts))
+    assert A.SystemProbes().mounts() == {'/', '/mnt/my nas'}
+
+
+@pytest.mark.skipif(ctypes.sizeof(ctypes.c_void_p) != 8, reason='offsets below are for 64-bit builds')
+def test_adapter_addresses_layout_matches_iphlpapi():
+    assert A._IP_ADAPTER_ADDRESSES.FriendlyName.offset == 0x48
+    assert A._IP_ADAPTER_ADDRESSES.OperStatus.offset == 0x68
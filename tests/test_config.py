@@ -0,0 +1,108 @@
+import json
+import random
+
+import AutoStarter as A
+
+
+class FakeListbox:
+    """Just enough of tkinter.Listbox for apply_items/refresh_listbox."""
+
+    def __init__(self):
+        self.rows = []
+        self.selected = None
+
+    def delete(self, first, last=None):
+        if last == A.END:
+            last = len(self.rows) - 1
+        del self.rows[first:(first if last is None else last) + 1]
+
+    def insert(self, index, text):
+        self.rows.insert(len(self.rows) if index == A.END else index, text)
+
+    def curselection(self):
+        return () if self.selected is None else (self.selected,)
+
+    def selection_clear(self, first, last=None):
+        self.selected = None
+
+    def selection_set(self, index):
+        self.selected = index
+
+
+def make_app(items):
+    app = A.StarterApp.__new__(A.StarterApp)
+    app.listbox = FakeListbox()
+    app.items = [dict(it) for it in items]
+    app.refresh_listbox()
+    return app
+
+
+def test_item_key_ignores_missing_name_and_includes_conditions():
+    assert A.item_key({'path': '/a', 'name': None}) == A.item_key({'path': '/a'})
+    assert A.item_key({'path': '/a'}) != A.item_key({'path': '/a', 'name': 'x'})
+    assert A.item_key({'path': '/a'}) != A.item_key({'path': '/a', 'conditions': {'ac_power': True}})
+    assert A.item_key('/a') == ('/a', None, None)
+
+
+def test_parse_items_accepts_strings_and_dicts():
+    items = A.parse_items(['/a', {'path': '/b', 'name': 'B'}])
+    assert [it['path'] for it in items] == [A.normalize_path('/a'), A.normalize_path('/b')]
+    assert items[1]['name'] == 'B'
+    assert A.parse_items({'not': 'a list'}) == []
+
+
+def test_apply_items_patches_only_changed_rows():
+    app = make_app([{'path': '/a'}, {'path': '/b'}, {'path': '/c'}])
+    app.listbox.selected = 1
+    changed = app.apply_items([{'path': '/a'}, {'path': '/x'}, {'path': '/b'}])
+    assert changed == 2
+    assert app.items == [{'path': '/a'}, {'path': '/x'}, {'path': '/b'}]
+    assert app.listbox.rows == [app._display_text(it) for it in app.items]
+    # selection follows /b to its new row
+    assert app.listbox.selected == 2
+
+
+def test_apply_items_fuzz_matches_full_refresh():
+    rng = random.Random(1234)
+    pool = [{'path': f'/p{i}'} for i in range(8)] + [{'path': '/p0', 'name': 'named'}]
+    for _ in range(300):
+        old = [rng.choice(pool) for _ in range(rng.randint(0, 7))]
+        new = [rng.choice(pool) for _ in range(rng.randint(0, 7))]
+        app = make_app(old)
+        app.apply_items([dict(it) for it in new])
+        assert [A.item_key(it) for it in app.items] == [A.item_key(it) for it in new]
+        assert app.listbox.rows == [app._display_text(it) for it in new]
+
+
+def test_save_items_digest_matches_file(tmp_path, monkeypatch):
+    monkeypatch.setenv('APPDATA', str(tmp_path))
+    ok, err, digest = A.save_items([{'path': '/a', 'name': 'A'}, {'path': ''}])
+    assert ok and err is None
+    assert digest == A.get_config_digest()
+    items, loaded_digest = A.load_items_snapshot()
+    assert loaded_digest == digest
+    assert [it['path'] for it in items] == [A.normalize_path('/a')]
+
+
+def test_save_items_to_side_path(tmp_path, monkeypatch):
+    monkeypatch.setenv('APPDATA', str(tmp_path))
+    side = str(tmp_path / 'items.json.conflict')
+    ok, _, _ = A.save_items([{'path': '/a'}], path=side)
+    assert ok
+    with open(side, encoding='utf-8') as f:
+        assert json.load(f) == [{'path': A.normalize_path('/a')}]
+    assert A.get_config_digest() is None
+
+
+def test_load_items_snapshot_quiet_on_corrupt_file(tmp_path, monkeypatch):
+    monkeypatch.setenv('APPDATA', str(tmp_path))
+    with open(A.get_config_path(), 'w', encoding='utf-8') as f:
+        f.write('[{broken')
+    items, digest = A.load_items_snapshot(quiet=True)
+    assert items is None
+    assert digest == A.get_config_digest()
+
+
+def test_load_items_snapshot_missing_file(tmp_path, monkeypatch):
+    monkeypatch.setenv('APPDATA', str(tmp_path))
+    assert A.load_items_snapshot() == ([], None)
@@ -0,0 +1,106 @@
+import json
+
+import AutoStarter as A
+
+
+def test_observe_puts_value_in_first_matching_bucket():
+    m = A.LaunchMetrics()
+    h = A._empty_histogram()
+    m._observe(h, 0.005)  # on the bound -> that bucket
+    m._observe(h, 0.3)
+    m._observe(h, 99.0)  # past the last bound -> +Inf
+    assert h['buckets'][0] == 1
+    assert h['buckets'][A.LATENCY_BUCKETS.index(0.5)] == 1
+    assert h['buckets'][-1] == 1
+    assert h['count'] == 3
+    assert abs(h['sum'] - 99.305) < 1e-9
+
+
+def test_launch_counted_once_outcome_known():
+    m = A.LaunchMetrics()
+    m.start_run()
+    m.record_spawn('/a', 0.01)
+    assert m.items['/a']['launches'] == 0
+    m.record_failure('/a')
+    m.record_spawn('/b', 0.01)
+    m.record_handoff('/b', 0.2)
+    m.record_spawn('/c', 0.01)
+    m.record_started('/c', 'started')
+    assert (m.items['/a']['launches'], m.items['/a']['failures']) == (0, 1)
+    assert m.items['/b']['launches'] == 1
+    assert m.items['/b']['handoff_seconds']['count'] == 1
+    assert m.items['/c']['launches'] == 1
+    # nothing past the spawn was measurable for /c
+    assert m.items['/c']['handoff_seconds']['count'] == 0
+
+
+def test_render_prometheus_cumulative_buckets():
+    m = A.LaunchMetrics()
+    m.start_run()
+    for seconds in (0.001, 0.02, 0.02, 20.0):
+        m.record_spawn('/a', seconds)
+    lines = m.render_prometheus().splitlines()
+    buckets = [l for l in lines if l.startswith('autostarter_spawn_seconds_bucket{item="/a"')]
+    counts = [int(l.rsplit(' ', 1)[1]) for l in buckets]
+    assert counts == sorted(counts)
+    assert buckets[0].endswith('le="0.005"} 1')
+    assert buckets[2].endswith('le="0.025"} 3')
+    assert buckets[-1].endswith('le="+Inf"} 4')
+    assert 'autostarter_spawn_seconds_count{item="/a"} 4' in lines
+    assert 'autostarter_runs_total 1' in lines
+
+
+def test_render_prometheus_escapes_labels():
+    m = A.LaunchMetrics()
+    m.record_skip('C:\\Apps\\"odd"\nname')
+    out = m.render_prometheus()
+    assert 'autostarter_skips_total{item="C:\\\\Apps\\\\\\"odd\\"\\nname"} 1' in out
+
+
+def test_prom_label_plain_path_unchanged():
+    assert A._prom_label('/usr/bin/app') == '/usr/bin/app'
+
+
+def test_untouched_items_are_pruned():
+    m = A.LaunchMetrics()
+    m.start_run()
+    m.record_skip('/gone')
+    for _ in range(A.METRICS_PRUNE_RUNS):
+        m.start_run()
+        m.record_skip('/kept')
+    assert '/gone' in m.items
+    m.start_run()
+    assert '/gone' not in m.items
+    assert '/kept' in m.items
+
+
+def test_round_trip_through_dict_keeps_counts():
+    m = A.LaunchMetrics()
+    m.start_run()
+    m.record_spawn('/a', 0.03)
+    m.record_handoff('/a', 0.4)
+    again = A.LaunchMetrics(json.loads(json.dumps(m.to_dict())))
+    assert again.runs == 1
+    assert again.items['/a']['launches'] == 1
+    assert again.items['/a']['spawn_seconds'] == m.items['/a']['spawn_seconds']
+
+
+def test_histogram_with_other_bucket_layout_is_reset():
+    data = {'items': {'/a': {'launches': 2, 'spawn_seconds': {'buckets': [1, 2], 'sum': 1.0, 'count': 3}}}}
+    m = A.LaunchMetrics(data)
+    assert m.items['/a']['launches'] == 2
+    assert m.items['/a']['spawn_seconds'] == A._empty_histogram()
+
+
+def test_write_is_atomic_pair(tmp_path, monkeypatch):
+    monkeypatch.setenv('APPDATA', str(tmp_path))
+    m = A.LaunchMetrics()
+    m.start_run()
+    m.record_skip('/a')
+    assert m.write() == (True, None)
+    prom_path, json_path = A.get_metrics_paths()
+    with open(json_path, encoding='utf-8') as f:
+        assert json.load(f)['items']['/a']['skips'] == 1
+    with open(prom_path, encoding='utf-8') as f:
+        assert 'autostarter_skips_total{item="/a"} 1' in f.read()
+    assert sorted(p.name for p in (tmp_path / A.APP_NAME).iterdir()) == ['metrics.json', 'metrics.prom']